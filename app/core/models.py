@@ -87,6 +87,7 @@ class Tag(models.Model):
     )
 
     name = models.CharField(max_length=255)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
@@ -101,6 +102,7 @@ class Ingredient(models.Model):
     )
 
     name = models.CharField(max_length=255)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
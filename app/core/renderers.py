@@ -0,0 +1,69 @@
+"""
+Renderers for the API.
+"""
+import math
+
+import orjson
+
+from rest_framework.renderers import JSONRenderer
+
+
+def _has_non_finite_float(data):
+    """Return True if data contains a NaN or infinite float."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(
+            _has_non_finite_float(key) or _has_non_finite_float(value)
+            for key, value in data.items()
+        )
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in data)
+
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON renderer backed by orjson.
+
+    Dates and times are passed to DRF's encoder so they are formatted as
+    ``JSONRenderer`` formats them, and non-string dict keys are coerced to
+    strings. Data orjson cannot encode the same way, such as integers
+    wider than 64 bits or NaN and infinite floats, is rendered by
+    ``JSONRenderer`` instead.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render data into JSON, returning a bytestring."""
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=option
+            )
+        except orjson.JSONEncodeError:
+            return super().render(
+                data, accepted_media_type, renderer_context
+            )
+
+        # orjson writes non-finite floats as null, so only look for them
+        # when the output contains one.
+        if b'null' in ret and _has_non_finite_float(data):
+            return super().render(
+                data, accepted_media_type, renderer_context
+            )
+
+        # Keep the output a strict javascript subset, as JSONRenderer does.
+        return ret.replace(
+            '\u2028'.encode(), b'\\u2028'
+        ).replace(
+            '\u2029'.encode(), b'\\u2029'
+        )
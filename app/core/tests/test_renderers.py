@@ -0,0 +1,90 @@
+"""
+Tests for API renderers.
+"""
+import json
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """Test the orjson backed renderer."""
+
+    def setUp(self):
+        self.renderer = ORJSONRenderer()
+
+    def test_render_matches_json(self):
+        """Test rendering produces the same JSON as the stdlib."""
+        data = [{'id': 1, 'name': 'Tomato'}, {'id': 2, 'name': 'Basil'}]
+
+        res = self.renderer.render(data)
+
+        self.assertEqual(json.loads(res), data)
+
+    def test_render_none_is_empty(self):
+        """Test rendering no data returns an empty body."""
+        self.assertEqual(self.renderer.render(None), b'')
+
+    def test_render_decimal(self):
+        """Test decimals fall back to the DRF encoder."""
+        res = self.renderer.render({'price': Decimal('5.25')})
+
+        self.assertEqual(json.loads(res), {'price': 5.25})
+
+    def test_render_escapes_line_separators(self):
+        """Test unicode line separators are escaped."""
+        res = self.renderer.render({'name': 'a\u2028b\u2029c'})
+
+        self.assertIn(b'\\u2028', res)
+        self.assertIn(b'\\u2029', res)
+        self.assertEqual(json.loads(res), {'name': 'a\u2028b\u2029c'})
+
+    def test_render_indent(self):
+        """Test an indent in the context pretty prints the output."""
+        res = self.renderer.render({'id': 1}, renderer_context={'indent': 4})
+
+        self.assertEqual(res, b'{\n  "id": 1\n}')
+
+    def test_render_non_str_keys(self):
+        """Test non-string dict keys are coerced to strings."""
+        res = self.renderer.render({1: 'a', 2.5: 'b'})
+
+        self.assertEqual(json.loads(res), {'1': 'a', '2.5': 'b'})
+
+    def test_render_non_finite_float_strict(self):
+        """Test NaN and infinity are rejected in strict mode."""
+        for value in [float('nan'), float('inf'), float('-inf')]:
+            with self.assertRaises(ValueError):
+                self.renderer.render({'values': [1.0, value]})
+
+    def test_render_non_finite_float_not_strict(self):
+        """Test NaN renders as NaN when strict mode is off."""
+        self.renderer.strict = False
+
+        res = self.renderer.render({'value': float('nan')})
+
+        self.assertEqual(res, b'{"value":NaN}')
+
+    def test_render_datetime_matches_json_renderer(self):
+        """Test datetimes are formatted by the DRF encoder."""
+        data = {
+            'at': datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc),
+            'on': date(2024, 1, 2),
+            'time': time(3, 4, 5),
+        }
+
+        res = self.renderer.render(data)
+
+        self.assertEqual(res, JSONRenderer().render(data))
+        self.assertEqual(json.loads(res)['at'], '2024-01-02T03:04:05.123456Z')
+
+    def test_render_big_int(self):
+        """Test integers wider than 64 bits are rendered."""
+        res = self.renderer.render({'value': 2 ** 70})
+
+        self.assertEqual(json.loads(res), {'value': 2 ** 70})
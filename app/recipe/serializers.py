@@ -1,13 +1,120 @@
 """
 Serializers for recipe APIs
 """
+from collections import OrderedDict
+from copy import copy
+from threading import Lock
 
+from django.conf import settings
+from django.db import models
+from django.utils.functional import cached_property
 from rest_framework import serializers
 
 from core.models import (Recipe, Tag, Ingredient)
 
 
-class IngredientSerializer(serializers.ModelSerializer):
+class CachedModelSerializer(serializers.ModelSerializer):
+    """Model serializer that builds its field map once per class."""
+    _fields_cache = {}
+
+    def get_fields(self):
+        """Return a copy of the cached fields for this serializer class."""
+        cls = type(self)
+        if cls not in cls._fields_cache:
+            cls._fields_cache[cls] = super().get_fields()
+
+        return {
+            name: self._clone_field(field)
+            for name, field in cls._fields_cache[cls].items()
+        }
+
+    @classmethod
+    def _clone_field(cls, field):
+        """Return an unbound copy of a field without deep copying it."""
+        if isinstance(field, serializers.ListSerializer):
+            kwargs = dict(field._kwargs, child=cls._clone_field(field.child))
+            return type(field)(*field._args, **kwargs)
+        if isinstance(field, serializers.BaseSerializer):
+            return type(field)(*field._args, **field._kwargs)
+
+        return copy(field)
+
+
+class PlainAttributeMixin:
+    """Serialize fields by reading model attributes directly.
+
+    Skips the generic get_attribute lookup for model instances when every
+    readable field maps to a single attribute on the instance.
+    """
+
+    @cached_property
+    def _plain_fields(self):
+        """Return (name, attribute, field) for each readable field."""
+        fields = tuple(self._readable_fields)
+        if any(len(field.source_attrs) != 1 for field in fields):
+            return None
+
+        return tuple(
+            (field.field_name, field.source_attrs[0], field)
+            for field in fields
+        )
+
+    def to_representation(self, instance):
+        """Convert an instance to primitive datatypes."""
+        if (not isinstance(instance, models.Model)
+                or self._plain_fields is None):
+            return super().to_representation(instance)
+
+        ret = OrderedDict()
+        for name, attr, field in self._plain_fields:
+            value = getattr(instance, attr)
+            ret[name] = None if value is None else field.to_representation(
+                value
+            )
+
+        return ret
+
+
+class CachedRepresentationMixin:
+    """Reuse the representation of rows that have not changed.
+
+    Each serializer class keeps its own LRU of up to
+    ``REPRESENTATION_CACHE_SIZE`` entries, keyed on the primary key and the
+    instance's ``updated_at`` timestamp, so ``save()`` invalidates them.
+    ``QuerySet.update()`` does not bump ``auto_now`` fields and leaves
+    stale entries behind until they are evicted; touch ``updated_at``
+    explicitly when bulk updating these models.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._repr_cache = OrderedDict()
+        cls._repr_cache_lock = Lock()
+
+    def to_representation(self, instance):
+        """Return the cached representation or compute and store it."""
+        if not isinstance(instance, models.Model) or instance.pk is None:
+            return super().to_representation(instance)
+
+        cache = self._repr_cache
+        key = (instance.pk, instance.updated_at)
+        with self._repr_cache_lock:
+            ret = cache.get(key)
+            if ret is not None:
+                cache.move_to_end(key)
+
+        if ret is None:
+            ret = super().to_representation(instance)
+            with self._repr_cache_lock:
+                cache[key] = ret
+                while len(cache) > settings.REPRESENTATION_CACHE_SIZE:
+                    cache.popitem(last=False)
+
+        return OrderedDict(ret)
+
+
+class IngredientSerializer(CachedRepresentationMixin,
+                           serializers.ModelSerializer):
     """Serialzier for Ingredients."""
 
     class Meta:
@@ -21,7 +128,7 @@ class IngredientSerializer(serializers.ModelSerializer):
         ]
 
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(CachedRepresentationMixin, serializers.ModelSerializer):
     """Serializer for Tags."""
     class Meta:
         model = Tag
@@ -34,7 +141,7 @@ class TagSerializer(serializers.ModelSerializer):
         ]
 
 
-class RecipeSerializer(serializers.ModelSerializer):
+class RecipeSerializer(PlainAttributeMixin, CachedModelSerializer):
     """Recipe serializer."""
     tags = TagSerializer(many=True, required=False)
     ingredients = IngredientSerializer(many=True, required=False)
@@ -51,6 +158,20 @@ class RecipeSerializer(serializers.ModelSerializer):
             'ingredients'
         ]
         read_only_fields = ['id']
+        prefetch_related = ('tags', 'ingredients')
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load related objects needed by the serializer up front."""
+        return queryset.prefetch_related(*cls.Meta.prefetch_related)
+
+    @classmethod
+    def get_column_names(cls):
+        """Return the model columns read by the serializer's fields."""
+        columns = {
+            field.name for field in cls.Meta.model._meta.concrete_fields
+        }
+        return [name for name in cls.Meta.fields if name in columns]
 
     def _get_or_create_tags(self, tags, recipe):
         """Handle getting or creating tags as needed."""
@@ -0,0 +1,9 @@
+"""
+URLs shared by the recipe API tests.
+"""
+from django.urls import reverse
+
+
+RECIPES_URL = reverse('recipe:recipe-list')
+TAGS_URL = reverse('recipe:tag-list')
+INGREDIENTS_URL = reverse('recipe:ingredient-list')
@@ -1,38 +1,41 @@
 """
 Tests for the ingredients API.
 """
+from types import MappingProxyType
 from decimal import Decimal
 
-from django.test import TestCase
-from django.urls import reverse
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 
-from rest_framework.test import APIClient
+from rest_framework.test import (APIClient,
+                                 APIRequestFactory,
+                                 force_authenticate)
 from rest_framework import status
 
 from core.models import Ingredient, Recipe
 
 from recipe.serializers import IngredientSerializer
+from recipe.views import IngredientsViewSets
+from recipe.tests._urls import INGREDIENTS_URL
 
-INGREDIENTS_URL = reverse('recipe:ingredient-list')
+FAST_PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+DEFAULT_USER = MappingProxyType({
+    'email': "test@example.com",
+    'password': "testpass123",
+    'name': "Test User"
+})
 
 
 def detail_url(ingredient_id):
     """Create and return a ingredient detail url."""
-    return reverse('recipe:ingredient-detail', args=[ingredient_id])
+    return f'{INGREDIENTS_URL}{ingredient_id}/'
 
 
 def create_user(**params):
     "Creates and return a new user"
-    defaults = {
-        'email': "test@example.com",
-        'password': "testpass123",
-        'name': "Test User"
-    }
-
-    defaults.update(params)
-
-    return get_user_model().objects.create_user(**defaults)
+    return get_user_model().objects.create_user(
+        **{**DEFAULT_USER, **params}
+    )
 
 
 def create_ingredient(user, name="Tomato"):
@@ -43,6 +46,7 @@ def create_ingredient(user, name="Tomato"):
     )
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class PublicAPITests(TestCase):
     """Test for unauthenticated users."""
 
@@ -55,28 +59,38 @@ class PublicAPITests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class PrivateAPITests(TestCase):
     """Tests for authenticated users."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
     def setUp(self):
         self.client = APIClient()
-        self.user = create_user()
         self.client.force_authenticate(self.user)
 
     def test_retrieving_ingredients(self):
         """Test for listing all the ingredients."""
 
-        create_ingredient(user=self.user)
-        create_ingredient(user=self.user)
+        ingredients = Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name='Tomato'),
+            Ingredient(user=self.user, name='Garlic'),
+        ])
 
-        res = self.client.get(INGREDIENTS_URL)
+        request = APIRequestFactory().get(INGREDIENTS_URL)
+        force_authenticate(request, user=self.user)
+        res = IngredientsViewSets.as_view({'get': 'list'})(request)
 
-        ingredients = Ingredient.objects.all()
-        serializer = IngredientSerializer(ingredients, many=True)
+        expected = [
+            {'id': i.id, 'name': i.name}
+            for i in sorted(ingredients, key=lambda i: i.name, reverse=True)
+        ]
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
-        self.assertEqual(len(serializer.data), 2)
+        self.assertEqual(res.data, expected)
+        self.assertEqual(len(res.data), 2)
 
     def test_retrieving_ingredients_limited_to_the_user(self):
         """Test for retrieving detail ingredients."""
@@ -85,16 +99,15 @@ class PrivateAPITests(TestCase):
             password="otheruserpass123"
         )
 
-        create_ingredient(user=self.user)
+        ingredient = create_ingredient(user=self.user)
         create_ingredient(user=other_user)
 
         res = self.client.get(INGREDIENTS_URL)
-        ingredients = Ingredient.objects.filter(user=self.user)
-        serializer = IngredientSerializer(ingredients, many=True)
+        expected = [{'id': ingredient.id, 'name': ingredient.name}]
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
-        self.assertEqual(len(serializer.data), 1)
+        self.assertEqual(res.data, expected)
+        self.assertEqual(len(res.data), 1)
 
     def test_update_ingredients(self):
         """Test for updating an ingredient."""
@@ -109,6 +122,19 @@ class PrivateAPITests(TestCase):
         self.assertEqual(ingredient.name, payload['name'])
         self.assertEqual(ingredient.user, self.user)
 
+    def test_list_ingredients_reflects_update(self):
+        """Test listing ingredients after an update returns the new name."""
+        ingredient = create_ingredient(user=self.user)
+        self.client.get(INGREDIENTS_URL)
+
+        res = self.client.patch(detail_url(ingredient.id), {'name': 'Mango'})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.client.get(INGREDIENTS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data[0]['name'], 'Mango')
+
     def test_delete_ingredients(self):
         """Test for deleting an ingredient."""
         ingredient = create_ingredient(user=self.user)
@@ -117,12 +143,14 @@ class PrivateAPITests(TestCase):
         res = self.client.delete(url)
 
         self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
-        self.assertFalse(Ingredient.objects.filter(id=ingredient.id))
+        self.assertFalse(Ingredient.objects.filter(id=ingredient.id).exists())
 
     def test_filter_ingredients_assigned_to_recipes(self):
         """Test listing ingredients by those assigned to recipes."""
-        in1 = create_ingredient(user=self.user, name="Apple")
-        in2 = create_ingredient(user=self.user, name="Turkey")
+        in1, in2 = Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name='Apple'),
+            Ingredient(user=self.user, name='Turkey'),
+        ])
         recipe = Recipe.objects.create(
             title='Apple Crumble',
             time_minutes=5,
@@ -141,25 +169,49 @@ class PrivateAPITests(TestCase):
 
     def test_filtered_ingredients_unique(self):
         """Test filtered ingredients returns a unique list."""
-        in1 = create_ingredient(user=self.user, name="Apple")
-        Ingredient.objects.create(user=self.user, name='Lentils')
+        in1, _ = Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name='Apple'),
+            Ingredient(user=self.user, name='Lentils'),
+        ])
+
+        recipe1, recipe2 = Recipe.objects.bulk_create([
+            Recipe(
+                title='Eggs',
+                time_minutes=60,
+                price=Decimal('7.00'),
+                user=self.user
+            ),
+            Recipe(
+                title='Her eggs',
+                time_minutes=20,
+                price=Decimal('4.00'),
+                user=self.user
+            ),
+        ])
+
+        RecipeIngredient = Recipe.ingredients.through
+        RecipeIngredient.objects.bulk_create([
+            RecipeIngredient(recipe=recipe1, ingredient=in1),
+            RecipeIngredient(recipe=recipe2, ingredient=in1),
+        ])
 
-        recipe1 = Recipe.objects.create(
-            title='Eggs',
-            time_minutes=60,
-            price=Decimal('7.00'),
-            user=self.user
-        )
+        res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
+        self.assertEqual(len(res.data), 1)
 
-        recipe2 = Recipe.objects.create(
-            title='Her eggs',
-            time_minutes=20,
-            price=Decimal('4.00'),
+    def test_filter_assigned_only_query_count(self):
+        """Test assigned_only listing uses one query for any row count."""
+        recipe = Recipe.objects.create(
+            title='Stew',
+            time_minutes=90,
+            price=Decimal('9.00'),
             user=self.user
         )
+        recipe.ingredients.add(*Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name=name)
+            for name in ['Beef', 'Carrot', 'Onion']
+        ]))
 
-        recipe1.ingredients.add(in1)
-        recipe2.ingredients.add(in1)
+        with self.assertNumQueries(1):
+            res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
 
-        res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
-        self.assertEqual(len(res.data), 1)
+        self.assertEqual(len(res.data), 3)
@@ -1,6 +1,7 @@
 """
 Tests for recipe API
 """
+from types import MappingProxyType
 import tempfile
 import os
 
@@ -18,9 +19,13 @@ from rest_framework import status
 from core.models import Recipe, Tag, Ingredient
 
 from recipe.serializers import (RecipeSerializer, RecipeDetailSerializer)
+from recipe.tests._urls import RECIPES_URL
 
-
-RECIPES_URL = reverse('recipe:recipe-list')
+DEFAULT_USER = MappingProxyType({
+    'email': "test@example.com",
+    'password': "testpass123",
+    'name': "Test User"
+})
 
 
 def detail_url(recipe_id):
@@ -50,15 +55,9 @@ def create_recipe(user, **params):
 
 def create_user(**params):
     "Creates and return a new user"
-    defaults = {
-        'email': "test@example.com",
-        'password': "testpass123",
-        'name': "Test User"
-    }
-
-    defaults.update(params)
-
-    return get_user_model().objects.create_user(**defaults)
+    return get_user_model().objects.create_user(
+        **{**DEFAULT_USER, **params}
+    )
 
 
 class PublicRecipeAPITests(TestCase):
@@ -220,7 +219,7 @@ class PrivateRecipeAPITests(TestCase):
         res = self.client.delete(url)
 
         self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
-        self.assertFalse(Recipe.objects.filter(id=recipe.id))
+        self.assertFalse(Recipe.objects.filter(id=recipe.id).exists())
 
     def test_recipe_other_users_recipe_error(self):
         """Test trying to delete another users recipe gives error."""
@@ -235,7 +234,7 @@ class PrivateRecipeAPITests(TestCase):
         res = self.client.delete(url)
 
         self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
-        self.assertTrue(Recipe.objects.filter(id=recipe.id))
+        self.assertTrue(Recipe.objects.filter(id=recipe.id).exists())
 
     def test_create_recipe_with_new_tags(self):
         """Create new recipe with new tags."""
@@ -467,6 +466,49 @@ class PrivateRecipeAPITests(TestCase):
         self.assertIn(s2.data, res.data)
         self.assertNotIn(s3.data, res.data)
 
+    def test_list_recipes_prefetches_relations(self):
+        """Test listing recipes does not query tags/ingredients per recipe."""
+        for title in ['Curry', 'Porridge', 'Soup']:
+            recipe = create_recipe(user=self.user, title=title)
+            recipe.tags.add(Tag.objects.create(user=self.user, name=title))
+            recipe.ingredients.add(
+                Ingredient.objects.create(user=self.user, name=title)
+            )
+
+        with self.assertNumQueries(3):
+            res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data), 3)
+
+    def test_serialize_recipe_without_instance(self):
+        """Test recipe data can be serialized from a dict or validated data."""
+        data = {
+            'id': 1,
+            'title': 'Curry',
+            'time_minutes': 30,
+            'price': Decimal('5.00'),
+            'link': '',
+            'tags': [],
+            'ingredients': [],
+        }
+        self.assertEqual(
+            RecipeSerializer(data).data,
+            {**data, 'price': '5.00'}
+        )
+
+        serializer = RecipeSerializer(data={
+            'title': 'Curry',
+            'time_minutes': 30,
+            'price': '5.00',
+        })
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.data, {
+            'title': 'Curry',
+            'time_minutes': 30,
+            'price': '5.00',
+        })
+
 
 class ImageUploadTests(TestCase):
     """Tests for the image upload API."""
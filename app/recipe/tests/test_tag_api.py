@@ -1,39 +1,42 @@
 """
 Tests for Tag API.
 """
+from types import MappingProxyType
 from decimal import Decimal
 
-from django.test import TestCase
-from django.urls import reverse
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 
-from rest_framework.test import APIClient
+from rest_framework.test import (APIClient,
+                                 APIRequestFactory,
+                                 force_authenticate)
 from rest_framework import status
 
 from core.models import Tag, Recipe
 
 from recipe.serializers import TagSerializer
+from recipe.views import TagsViewSets
+from recipe.tests._urls import TAGS_URL
 
 
-TAGS_URL = reverse('recipe:tag-list')
+FAST_PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+DEFAULT_USER = MappingProxyType({
+    'email': "test@example.com",
+    'password': "testpass123",
+    'name': "Test User"
+})
 
 
 def detail_url(tag_id):
     """Create and return a tag detail url."""
-    return reverse('recipe:tag-detail', args=[tag_id])
+    return f'{TAGS_URL}{tag_id}/'
 
 
 def create_user(**params):
     "Creates and return a new user"
-    defaults = {
-        'email': "test@example.com",
-        'password': "testpass123",
-        'name': "Test User"
-    }
-
-    defaults.update(params)
-
-    return get_user_model().objects.create_user(**defaults)
+    return get_user_model().objects.create_user(
+        **{**DEFAULT_USER, **params}
+    )
 
 
 def create_tag(user, name="Main Dish"):
@@ -44,6 +47,7 @@ def create_tag(user, name="Main Dish"):
     )
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class PublicTagAPITests(TestCase):
     """Test public tag API."""
 
@@ -57,27 +61,37 @@ class PublicTagAPITests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class PrivateTagAPITests(TestCase):
     """Test private Tag API."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
     def setUp(self):
         self.client = APIClient()
-        self.user = create_user()
         self.client.force_authenticate(self.user)
 
     # We want to test getting all tags
     def test_retrieve_tags(self):
         """Test for retrieving all the tags."""
-        create_tag(user=self.user)
-        create_tag(user=self.user)
+        tags = Tag.objects.bulk_create([
+            Tag(user=self.user, name='Vegan'),
+            Tag(user=self.user, name='Dessert'),
+        ])
 
-        res = self.client.get(TAGS_URL)
+        request = APIRequestFactory().get(TAGS_URL)
+        force_authenticate(request, user=self.user)
+        res = TagsViewSets.as_view({'get': 'list'})(request)
 
-        tags = Tag.objects.all().order_by('-name')
-        serializer = TagSerializer(tags, many=True)
+        expected = [
+            {'id': tag.id, 'name': tag.name}
+            for tag in sorted(tags, key=lambda tag: tag.name, reverse=True)
+        ]
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data, expected)
 
     # We want to test getting a specific tag
     def test_retrieve_tags_limited_to_the_user(self):
@@ -113,6 +127,30 @@ class PrivateTagAPITests(TestCase):
         self.assertEqual(tag.name, payload['name'])
         self.assertEqual(tag.user, self.user)
 
+    def test_list_tags_reflects_update(self):
+        """Test listing tags after an update returns the new name."""
+        tag = create_tag(user=self.user)
+        self.client.get(TAGS_URL)
+
+        res = self.client.patch(detail_url(tag.id), {'name': 'Dessert'})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.client.get(TAGS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data[0]['name'], 'Dessert')
+
+    def test_serialize_tag_without_instance(self):
+        """Test tag data can be serialized from a dict or validated data."""
+        self.assertEqual(
+            TagSerializer({'id': 1, 'name': 'Vegan'}).data,
+            {'id': 1, 'name': 'Vegan'}
+        )
+
+        serializer = TagSerializer(data={'name': 'Vegan'})
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.data, {'name': 'Vegan'})
+
     # We want to test deleting a tag
     def test_delete_tag(self):
         tag = create_tag(user=self.user)
@@ -121,12 +159,14 @@ class PrivateTagAPITests(TestCase):
         res = self.client.delete(url)
 
         self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
-        self.assertFalse(Tag.objects.filter(id=tag.id))
+        self.assertFalse(Tag.objects.filter(id=tag.id).exists())
 
     def test_filter_tags_assigned_to_recipes(self):
         """Test listing tags by those assigned to recipes."""
-        tag1 = create_tag(user=self.user, name="Apple")
-        tag2 = create_tag(user=self.user, name="Turkey")
+        tag1, tag2 = Tag.objects.bulk_create([
+            Tag(user=self.user, name='Apple'),
+            Tag(user=self.user, name='Turkey'),
+        ])
         recipe = Recipe.objects.create(
             title='Apple Crumble',
             time_minutes=5,
@@ -145,25 +185,49 @@ class PrivateTagAPITests(TestCase):
 
     def test_filtered_tags_unique(self):
         """Test filtered tags returns a unique list."""
-        tag1 = create_tag(user=self.user, name="Apple")
-        Tag.objects.create(user=self.user, name='Lentils')
+        tag1, _ = Tag.objects.bulk_create([
+            Tag(user=self.user, name='Apple'),
+            Tag(user=self.user, name='Lentils'),
+        ])
+
+        recipe1, recipe2 = Recipe.objects.bulk_create([
+            Recipe(
+                title='Eggs',
+                time_minutes=60,
+                price=Decimal('7.00'),
+                user=self.user
+            ),
+            Recipe(
+                title='Her eggs',
+                time_minutes=20,
+                price=Decimal('4.00'),
+                user=self.user
+            ),
+        ])
+
+        RecipeTag = Recipe.tags.through
+        RecipeTag.objects.bulk_create([
+            RecipeTag(recipe=recipe1, tag=tag1),
+            RecipeTag(recipe=recipe2, tag=tag1),
+        ])
 
-        recipe1 = Recipe.objects.create(
-            title='Eggs',
-            time_minutes=60,
-            price=Decimal('7.00'),
-            user=self.user
-        )
+        res = self.client.get(TAGS_URL, {'assigned_only': 1})
+        self.assertEqual(len(res.data), 1)
 
-        recipe2 = Recipe.objects.create(
-            title='Her eggs',
-            time_minutes=20,
-            price=Decimal('4.00'),
+    def test_filter_assigned_only_query_count(self):
+        """Test assigned_only listing uses one query for any row count."""
+        recipe = Recipe.objects.create(
+            title='Stew',
+            time_minutes=90,
+            price=Decimal('9.00'),
             user=self.user
         )
+        recipe.tags.add(*Tag.objects.bulk_create([
+            Tag(user=self.user, name=name)
+            for name in ['Beef', 'Carrot', 'Onion']
+        ]))
 
-        recipe1.tags.add(tag1)
-        recipe2.tags.add(tag1)
+        with self.assertNumQueries(1):
+            res = self.client.get(TAGS_URL, {'assigned_only': 1})
 
-        res = self.client.get(TAGS_URL, {'assigned_only': 1})
-        self.assertEqual(len(res.data), 1)
+        self.assertEqual(len(res.data), 3)
@@ -2,6 +2,7 @@
 Views for the recipe APIs.
 """
 
+from django.db.models import (Exists, OuterRef)
 from drf_spectacular.utils import (extend_schema_view,
                                    extend_schema,
                                    OpenApiParameter,
@@ -57,6 +58,15 @@ class RecipeViewSets(viewsets.ModelViewSet):
             ingredients_ids = self._params_to_ints(ingredients)
             queryset = queryset.filter(ingredients__id__in=ingredients_ids)
 
+        if self.action == 'list':
+            queryset = queryset.only(
+                *serializers.RecipeSerializer.get_column_names()
+            )
+
+        serializer_class = self.get_serializer_class()
+        if hasattr(serializer_class, 'setup_eager_loading'):
+            queryset = serializer_class.setup_eager_loading(queryset)
+
         return queryset.filter(
             user=self.request.user
             ).order_by('-id').distinct()
@@ -109,12 +119,19 @@ class BaseRecipeAttrViewSet(mixins.DestroyModelMixin, mixins.UpdateModelMixin,
         )
         queryset = self.queryset
         if assigned_only:
-            queryset = queryset.filter(recipe__isnull=False)
+            model = queryset.model
+            recipe_links = model.recipe_set.through.objects.filter(
+                **{f'{model._meta.model_name}_id': OuterRef('pk')}
+            )
+            queryset = queryset.filter(Exists(recipe_links))
+
+        if self.action == 'list':
+            queryset = queryset.only('id', 'name', 'updated_at')
 
         """Retrieve recipes for authenticated user."""
         return queryset.filter(
             user=self.request.user
-            ).order_by('-name').distinct()
+            ).order_by('-name')
 
 
 class TagsViewSets(BaseRecipeAttrViewSet):